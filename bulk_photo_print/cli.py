@@ -6,14 +6,14 @@ import sys
 
 import os
 
-import re
+import functools
 
 from dataclasses import dataclass
 
 from typing import List, NamedTuple, Optional, Mapping
 
 from bulk_photo_print.picture import Picture, FitMode
-from bulk_photo_print.packing import pack, PicturesDoNotFitError
+from bulk_photo_print.packing import pack, PicturesDoNotFitError, PACKING_ALGORITHMS
 from bulk_photo_print.render import render
 
 import shutil
@@ -45,20 +45,52 @@ UNITS = {
 Conversions from common units to millimeters.
 """
 
-DIMENSION_REGEX = re.compile(
-    r"(\d+(?:[.]\d*)?|[.]\d+)\s*({})".format("|".join(re.escape(u) for u in UNITS)),
-    re.IGNORECASE | re.ASCII,
-)
+MM_PER_INCH = UNITS["inch"]
+"""
+The number of millimeters in an inch.
+"""
+
+DEFAULT_PAGE_WIDTH = 210.0
+DEFAULT_PAGE_HEIGHT = 297.0
+"""
+The default page size (A4), in mm.
+"""
+
+DEFAULT_MARGIN = 5.0
+"""
+The default margin around the page edge, in mm.
+"""
+
+DEFAULT_PICTURE_WIDTH = 3 * MM_PER_INCH
+DEFAULT_PICTURE_HEIGHT = 4 * MM_PER_INCH
+"""
+The default picture dimensions (3x4"), in mm.
+"""
+
+DEFAULT_PIXELS_PER_MM = 300 / MM_PER_INCH
+"""
+The default maximum picture resolution (300 DPI).
+"""
 
 
 def parse_dimension(dimension: str) -> float:
     """Parse a dimension specification string into millimeters."""
-    match = DIMENSION_REGEX.fullmatch(dimension)
-    if match is None:
+    # NB: The grammar here (a number followed by an optional unit) is simple
+    # enough that a regular expression would be overkill.
+    stripped = dimension.strip()
+    number_end = 0
+    while number_end < len(stripped) and stripped[number_end] in "0123456789.":
+        number_end += 1
+    number = stripped[:number_end]
+    unit = stripped[number_end:].strip().lower()
+
+    if unit not in UNITS:
+        raise ValueError(dimension)
+    try:
+        return float(number) * UNITS[unit]
+    except ValueError:
+        # Missing or malformed number (e.g. "", "." or "1.2.3")
         raise ValueError(dimension)
-    else:
-        number, unit = match.groups()
-        return float(number) * UNITS[unit.lower()]
 
 
 @dataclass
@@ -66,16 +98,19 @@ class ParsedArguments:
     pictures: List[Picture]
     """The pictures to print (with dimensions in mm)."""
 
-    page_width: float = 210.0
-    page_height: float = 297.0
+    page_width: float = DEFAULT_PAGE_WIDTH
+    page_height: float = DEFAULT_PAGE_HEIGHT
     """The page size to print onto, in mm."""
 
-    margin: float = 5.0
+    margin: float = DEFAULT_MARGIN
     """The margin to leave around the page edge, in mm."""
 
     output_filename: str = "out.pdf"
     """The filename to write the generated PDF to."""
 
+    packing_algorithm: str = "guillotine"
+    """The name of the packing algorithm to use (see PACKING_ALGORITHMS)."""
+
 
 class ArgumentParserError(Exception):
     """Parse error during argument parsing."""
@@ -115,6 +150,15 @@ ARGUMENTS: Mapping[str, Argument] = {
         "FILENAME",
         "The output filename. Defaults to out.pdf.",
     ),
+    "packer": Argument(
+        ["--packer", "-P"],
+        "ALGORITHM",
+        """
+            The algorithm used to pack pictures onto pages. One of 'guillotine'
+            (the default), 'maxrects' or 'skyline'. Only 'guillotine' ensures
+            the pictures can be cut apart with a guillotine.
+        """,
+    ),
     "picture_dimensions": Argument(
         ["--picture-dimensions", "-d"],
         "WIDTH HEIGHT",
@@ -189,6 +233,16 @@ All supported arguments along with metavariables for the argument and
 documentation strings.
 """
 
+ARGUMENT_KINDS: Mapping[str, str] = {
+    name: kind
+    for kind, argument in ARGUMENTS.items()
+    for name in argument.argument_names
+}
+"""
+Lookup from argument name (e.g. '--help') to the corresponding key in
+:py:data:`ARGUMENTS`.
+"""
+
 
 def parse_arguments(args: List[str]) -> ParsedArguments:
     """
@@ -198,34 +252,41 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
     """
     # Page dimensions and margin. Defaults to A4 with 5mm margins. Must be set
     # before any pictures are specified.
-    page_width: float = parse_dimension("210mm")
-    page_height: float = parse_dimension("297mm")
-    margin: float = parse_dimension("5mm")
+    page_width: float = DEFAULT_PAGE_WIDTH
+    page_height: float = DEFAULT_PAGE_HEIGHT
+    page_aspect: float = page_height / page_width
+    margin: float = DEFAULT_MARGIN
 
     output_filename: str = "out.pdf"
 
+    packing_algorithm: str = "guillotine"
+
     # Picture dimensions. Defaults to cropping to fit a 3x4" standard size. Can
     # be altered as arguments are parsed.
-    desired_width: float = parse_dimension("3 inches")
-    desired_height: float = parse_dimension("4 inches")
+    desired_width: float = DEFAULT_PICTURE_WIDTH
+    desired_height: float = DEFAULT_PICTURE_HEIGHT
+    desired_aspect: float = desired_height / desired_width
     fit_mode: FitMode = FitMode.crop
     x_alignment: float = 0.5
     y_alignment: float = 0.5
     rotate_for_best_fit: bool = True
-    pixels_per_mm: Optional[float] = 300 / parse_dimension("1 inch")
+    pixels_per_mm: Optional[float] = DEFAULT_PIXELS_PER_MM
 
     pictures: List[Picture] = []
 
     args = args[1:]  # Strip program name (and make a copy for mutation)
     while args:
         argument = args.pop(0)
+        kind = ARGUMENT_KINDS.get(argument)
 
-        if argument in ARGUMENTS["help"].argument_names:
+        if kind == "help":
             raise ShowHelp()
-        elif argument in ARGUMENTS["page_dimensions"].argument_names:
+        elif kind == "page_dimensions":
+            # NB: page_aspect is computed once here, and the page dimensions
+            # are then fixed for all pictures.
             if len(pictures) != 0:
                 raise ArgumentParserError(
-                    "{argument} must appear before picture filenames"
+                    f"{argument} must appear before picture filenames"
                 )
             try:
                 page_width = parse_dimension(args.pop(0))
@@ -234,10 +295,15 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
                 raise ArgumentParserError(f"{argument} expects a WIDTH and HEIGHT")
             except ValueError:
                 raise ArgumentParserError(f"invalid dimension passed to {argument}")
-        elif argument in ARGUMENTS["margin"].argument_names:
+            if page_width <= 0 or page_height <= 0:
+                raise ArgumentParserError(
+                    f"{argument} dimensions must be greater than zero"
+                )
+            page_aspect = page_height / page_width
+        elif kind == "margin":
             if len(pictures) != 0:
                 raise ArgumentParserError(
-                    "{argument} must appear before picture filenames"
+                    f"{argument} must appear before picture filenames"
                 )
             try:
                 margin = parse_dimension(args.pop(0))
@@ -245,12 +311,19 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
                 raise ArgumentParserError(f"{argument} expects a SIZE")
             except ValueError:
                 raise ArgumentParserError(f"invalid dimension passed to {argument}")
-        elif argument in ARGUMENTS["output"].argument_names:
+        elif kind == "output":
             try:
                 output_filename = args.pop(0)
             except IndexError:
                 raise ArgumentParserError(f"{argument} expects a FILENAME")
-        elif argument in ARGUMENTS["picture_dimensions"].argument_names:
+        elif kind == "packer":
+            try:
+                packing_algorithm = args.pop(0)
+            except IndexError:
+                raise ArgumentParserError(f"{argument} expects an ALGORITHM")
+            if packing_algorithm not in PACKING_ALGORITHMS:
+                raise ArgumentParserError(f"unknown algorithm passed to {argument}")
+        elif kind == "picture_dimensions":
             try:
                 desired_width = parse_dimension(args.pop(0))
                 desired_height = parse_dimension(args.pop(0))
@@ -258,11 +331,16 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
                 raise ArgumentParserError(f"{argument} expects a WIDTH and HEIGHT")
             except ValueError:
                 raise ArgumentParserError(f"invalid dimension passed to {argument}")
-        elif argument in ARGUMENTS["crop"].argument_names:
+            if desired_width <= 0 or desired_height <= 0:
+                raise ArgumentParserError(
+                    f"{argument} dimensions must be greater than zero"
+                )
+            desired_aspect = desired_height / desired_width
+        elif kind == "crop":
             fit_mode = FitMode.crop
-        elif argument in ARGUMENTS["scale"].argument_names:
+        elif kind == "scale":
             fit_mode = FitMode.scale
-        elif argument in ARGUMENTS["alignment"].argument_names:
+        elif kind == "alignment":
             try:
                 x_alignment = float(args.pop(0))
                 y_alignment = float(args.pop(0))
@@ -274,11 +352,11 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
                 )
             except ValueError:
                 raise ArgumentParserError(f"invalid alignment passed to {argument}")
-        elif argument in ARGUMENTS["rotate_for_best_fit"].argument_names:
+        elif kind == "rotate_for_best_fit":
             rotate_for_best_fit = True
-        elif argument in ARGUMENTS["no_rotate_for_best_fit"].argument_names:
+        elif kind == "no_rotate_for_best_fit":
             rotate_for_best_fit = False
-        elif argument in ARGUMENTS["dpi"].argument_names:
+        elif kind == "dpi":
             try:
                 dpi = float(args.pop(0))
             except IndexError:
@@ -288,7 +366,7 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
             if dpi <= 0:
                 pixels_per_mm = None
             else:
-                pixels_per_mm = dpi / parse_dimension("1 inch")
+                pixels_per_mm = dpi / MM_PER_INCH
         elif argument.startswith("-"):
             raise ArgumentParserError(f"unknown argument {argument}")
         else:
@@ -298,8 +376,6 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
             # match this paper's orientation. In general this results in
             # superiour packing performance for the picture packing heuristic
             # with smaller pictures.
-            page_aspect = page_height / page_width
-            desired_aspect = desired_height / desired_width
             if (
                 rotate_for_best_fit
                 and page_aspect != 1.0
@@ -334,14 +410,24 @@ def parse_arguments(args: List[str]) -> ParsedArguments:
         page_height=page_height,
         margin=margin,
         output_filename=output_filename,
+        packing_algorithm=packing_algorithm,
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_terminal_width() -> int:
+    """
+    Get the width of the terminal. Cached since the (many) calls made while
+    rendering a message ought to agree anyway.
+    """
+    return shutil.get_terminal_size((80, 20)).columns
+
+
 def wrap(text: str, indent: str = "") -> str:
     """
     Indent and line-wrap a string to fit in the current terminal width.
     """
-    width = shutil.get_terminal_size((80, 20)).columns
+    width = get_terminal_width()
     return textwrap.indent(textwrap.fill(text, width - len(indent)), indent)
 
 
@@ -426,6 +512,7 @@ def main() -> None:
             args.pictures,
             args.page_width - args.margin * 2,
             args.page_height - args.margin * 2,
+            PACKING_ALGORITHMS[args.packing_algorithm],
         )
     except PicturesDoNotFitError:
         sys.stderr.write("error: picture too large for page\n")
@@ -1,4 +1,4 @@
-from typing import NamedTuple, List, cast
+from typing import NamedTuple, List, Mapping, Any, cast
 
 from decimal import Decimal
 
@@ -9,6 +9,24 @@ import rectpack  # type: ignore
 from bulk_photo_print.picture import Picture
 
 
+PACKING_ALGORITHMS: Mapping[str, Any] = {
+    # The guillotine algorithm with Best-Area-First ('Baf'; meaning picking the
+    # smallest rectangle which can fit the picture) and Minimum-Area-Split
+    # ('Minas'; attempt to split free space to make the largest rectangle
+    # possible). Produces layouts which can be cut apart with a guillotine.
+    "guillotine": rectpack.GuillotineBafMinas,
+    # The maximal rectangles algorithm with Best-Short-Side-Fit.
+    "maxrects": rectpack.MaxRectsBssf,
+    # The skyline algorithm with Bottom-Left placement and Waste-Map.
+    "skyline": rectpack.SkylineBlWm,
+}
+"""
+The rectpack packing algorithms which may be passed to :py:func:`pack`, by
+name. Only 'guillotine' guarantees that the output may be cut apart using a
+guillotine.
+"""
+
+
 def to_decimal(number: float) -> Decimal:
     """
     A wrapper around :py:func:`rectpack.float2dec` with a fixed number of
@@ -34,29 +52,34 @@ class PicturesDoNotFitError(ValueError):
 
 
 def pack(
-    pictures: List[Picture], page_width: float, page_height: float
+    pictures: List[Picture],
+    page_width: float,
+    page_height: float,
+    pack_algo: Any = PACKING_ALGORITHMS["guillotine"],
 ) -> List[List[PictureLocation]]:
     """
     Pack a series of pictures into pages of the specified size. Returns a
     series of lists, one per page, containing :py:class:`PictureLocation`
     objects for each picture placed on that page.
+
+    The ``pack_algo`` argument gives the rectpack packing algorithm to use
+    (see :py:data:`PACKING_ALGORITHMS`).
     """
     packer = rectpack.newPacker(
         # Offline packing mode
         mode=rectpack.PackingMode.Offline,
         # Try each bin in turn, most promising first
         bin_algo=rectpack.PackingBin.Global,
-        # Use the guillotine algorithm with Best-Area-First ('Baf'; meaning picking
-        # the smallest rectangle which can fit the picture) and Minimum-Area-Split
-        # ('Minas'; attempt to split free space to make the largest rectangle
-        # possible).
-        pack_algo=rectpack.GuillotineBafMinas,
+        pack_algo=pack_algo,
         # Pack starting with the largest pictures first
         sort_algo=rectpack.SORT_AREA,
         # Allow pictures to be rotated.
         rotation=True,
     )
 
+    # NB: Dimensions are given to rectpack as (quantised) Decimals since it
+    # makes exact comparisons between sums of sizes. With floats, rounding
+    # errors can prevent pictures which exactly tile a page from fitting.
     packer.add_bin(
         width=to_decimal(page_width),
         height=to_decimal(page_height),
@@ -89,12 +112,12 @@ def pack(
     ]
 
     # Check for missing pictures
-    missing_pictures = list(pictures)
+    missing_pictures = {id(picture): picture for picture in pictures}
     for page in out:
         for picture_location in page:
-            missing_pictures.remove(picture_location.picture)
+            missing_pictures.pop(id(picture_location.picture), None)
 
     if missing_pictures:
-        raise PicturesDoNotFitError(missing_pictures)
+        raise PicturesDoNotFitError(list(missing_pictures.values()))
 
     return out
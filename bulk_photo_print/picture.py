@@ -1,5 +1,9 @@
 from typing import cast, Tuple, Optional
 
+import os
+
+import functools
+
 from enum import Enum, auto
 
 from dataclasses import dataclass, field
@@ -21,6 +25,71 @@ class FitMode(Enum):
     """
 
 
+def read_image_info(filename: str) -> Tuple[int, int, bool]:
+    """
+    Read the dimensions (in pixels) of an image file and whether it has an
+    alpha channel. Only the image header is read; the image data is not
+    decoded. Results are cached for as long as the file is not modified.
+    """
+    return read_image_info_cached(filename, os.stat(filename).st_mtime)
+
+
+@functools.lru_cache(maxsize=1024)
+def read_image_info_cached(filename: str, mtime: float) -> Tuple[int, int, bool]:
+    """
+    Implements :py:func:`read_image_info`. The file's modification time is
+    included in the arguments to ensure stale cache entries are not used.
+    """
+    with Image.open(filename) as im:
+        width, height = cast(Tuple[int, int], im.size)
+        has_alpha = "A" in im.getbands() or "transparency" in im.info
+        return (width, height, has_alpha)
+
+
+def load_image(
+    filename: str,
+    rotate_image: bool,
+    image_width: int,
+    image_height: int,
+    has_alpha: bool,
+) -> Image.Image:
+    """
+    Load an image file, rotating and resampling it to the specified size and
+    converting it to RGBA (or RGB if has_alpha is False).
+    """
+    im = Image.open(filename)
+
+    # The image dimensions prior to rotation
+    if rotate_image:
+        unrotated_width, unrotated_height = image_height, image_width
+    else:
+        unrotated_width, unrotated_height = image_width, image_height
+
+    # For JPEGs, have the decoder downscale by a power of two during
+    # decoding when the image would otherwise be substantially downsampled
+    # later anyway. Twice the target size is requested to leave the
+    # bicubic resampling below something to work with.
+    if im.format == "JPEG":
+        im.draft("RGB", (unrotated_width * 2, unrotated_height * 2))
+
+    # Resize if necessary. (NB: Done before rotation so that the rotation is
+    # performed on the smaller, resampled image.)
+    if cast(Tuple[int, int], im.size) != (unrotated_width, unrotated_height):
+        im = im.resize((unrotated_width, unrotated_height), Image.BICUBIC)
+
+    # Rotate if necessary
+    if rotate_image:
+        im = im.transpose(Image.ROTATE_270)
+
+    # Convert into RGBA or RGB. (NB: convert fills in an opaque alpha channel
+    # in the same pass, where putalpha would require a second pass.)
+    mode = "RGBA" if has_alpha else "RGB"
+    if im.mode != mode:
+        im = im.convert(mode)
+
+    return im
+
+
 @dataclass
 class Picture:
     filename: str
@@ -28,6 +97,9 @@ class Picture:
     rotate_image: bool
     """If True, the image must be rotated degrees after loading."""
 
+    has_alpha: bool
+    """If True, the image has an alpha channel (i.e. may be transparent)."""
+
     image_width: int
     image_height: int
     """
@@ -89,8 +161,7 @@ class Picture:
         must be rescaled to the specified resolution. If None, no rescaling
         should occur.
         """
-        im = Image.open(filename)
-        image_width, image_height = cast(Tuple[int, int], im.size)
+        image_width, image_height, has_alpha = read_image_info(filename)
         image_aspect = image_height / image_width
         rotate_image = False
 
@@ -132,8 +203,9 @@ class Picture:
             raise NotImplementedError(fit_mode)
 
         if pixels_per_mm is not None:
-            if pixels_per_mm < (1 / scale):
-                rescale = pixels_per_mm / (1 / scale)
+            image_pixels_per_mm = 1 / scale
+            if pixels_per_mm < image_pixels_per_mm:
+                rescale = pixels_per_mm / image_pixels_per_mm
                 image_width = int(image_width * rescale)
                 image_height = int(image_height * rescale)
                 scale = 1 / pixels_per_mm
@@ -141,6 +213,7 @@ class Picture:
         return cls(
             filename=filename,
             rotate_image=rotate_image,
+            has_alpha=has_alpha,
             image_width=image_width,
             image_height=image_height,
             width=width,
@@ -153,22 +226,21 @@ class Picture:
     def get_image_bytes(self) -> memoryview:
         """
         Return a mutable memoryview of an 8bit BGRA image, decoded and rotated
-        (as required) containing this picture.
+        (as required) containing this picture. If the picture has no alpha
+        channel, the alpha bytes are left undefined (i.e. the image is BGRX).
         """
-        im = Image.open(self.filename)
-
-        # Rotate if necessary
-        if self.rotate_image:
-            im = im.transpose(Image.ROTATE_270)
-
-        # Resize if necessary
-        if cast(Tuple[int, int], im.size) != (self.image_width, self.image_height):
-            im = im.resize(
-                (self.image_width, self.image_height),
-                Image.BICUBIC,
-            )
-
-        # Convert into RGBA
-        if "A" not in im.getbands():
-            im.putalpha(256)
-        return memoryview(bytearray(im.tobytes("raw", "BGRa")))
+        im = load_image(
+            self.filename,
+            self.rotate_image,
+            self.image_width,
+            self.image_height,
+            self.has_alpha,
+        )
+
+        # NB: A fresh buffer is deliberately allocated for every call. Cairo
+        # surfaces created from this buffer reference it directly and
+        # (in the case of PDF surfaces) may only read it when the page is
+        # finished, so buffers must not be shared between pictures.
+        return memoryview(
+            bytearray(im.tobytes("raw", "BGRa" if self.has_alpha else "BGRX"))
+        )
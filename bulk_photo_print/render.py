@@ -1,6 +1,10 @@
 import math
 
-from typing import List
+import os
+
+from typing import List, Dict, Tuple
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 from dataclasses import dataclass
 
@@ -14,21 +18,62 @@ def mm_to_pt(mm: float) -> float:
     return mm * 2.8346457
 
 
-def render_picture(ctx: cairo.Context, picture: Picture) -> None:
+def get_image_key(picture: Picture) -> Tuple[str, bool, int, int]:
     """
-    Render a picture at (0, 0) onto the supplied context (which should use mm
-    units).
+    Return a key which is identical for all pictures with identical pixel data
+    (i.e. :py:meth:`Picture.get_image_bytes` would return the same result).
     """
-    ctx.save()
+    return (
+        picture.filename,
+        picture.rotate_image,
+        picture.image_width,
+        picture.image_height,
+    )
 
-    # Load the picture
-    image_surface = cairo.ImageSurface.create_for_data(
+
+def create_image_surface(picture: Picture) -> cairo.ImageSurface:
+    """
+    Decode a picture into a new Cairo image surface.
+    """
+    # NB: Pycairo keeps the image buffer alive as long as the surface
+    return cairo.ImageSurface.create_for_data(
         picture.get_image_bytes(),
-        cairo.FORMAT_ARGB32,
+        # NB: Cairo composites opaque surfaces more cheaply
+        cairo.FORMAT_ARGB32 if picture.has_alpha else cairo.FORMAT_RGB24,
         picture.image_width,
         picture.image_height,
     )
 
+
+def decode_page(
+    executor: Executor,
+    page: List[PictureLocation],
+    image_surfaces: Dict[Tuple[str, bool, int, int], "Future[cairo.ImageSurface]"],
+) -> None:
+    """
+    Start decoding the pictures on a page into image surfaces using the
+    supplied executor. Futures are added to ``image_surfaces`` (keyed by
+    :py:func:`get_image_key`), skipping any pictures already present so that
+    pictures appearing more than once are only decoded once.
+    """
+    for picture_location in page:
+        key = get_image_key(picture_location.picture)
+        if key not in image_surfaces:
+            image_surfaces[key] = executor.submit(
+                create_image_surface, picture_location.picture
+            )
+
+
+def render_picture(
+    ctx: cairo.Context, picture: Picture, image_surface: cairo.ImageSurface
+) -> None:
+    """
+    Render a picture at (0, 0) onto the supplied context (which should use mm
+    units). The picture's pixels are given by ``image_surface``, as produced by
+    :py:func:`create_image_surface`.
+    """
+    ctx.save()
+
     # Scale and translate the picture according to the scale/crop mode in use.
     #
     # NB: Pattern matrix maps from page space to pixel space, hence the
@@ -60,18 +105,38 @@ def render(
     Picture locations and sizes should be given in millimeters with (0, 0)
     being the coordinate of the top-left of the page within the page margin.
     """
-
-    with cairo.PDFSurface(
+    # Pictures are decoded in parallel (Pillow releases the GIL while decoding
+    # and resampling images), one page ahead of the page being drawn. Decoded
+    # pictures are kept only until the last page which uses them has been
+    # drawn. This bounds memory use while still decoding pictures repeated
+    # across several pages just once.
+    last_use = {
+        get_image_key(picture_location.picture): page_number
+        for page_number, page in enumerate(picture_locations)
+        for picture_location in page
+    }
+    image_surfaces: Dict[Tuple[str, bool, int, int], "Future[cairo.ImageSurface]"] = {}
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor, cairo.PDFSurface(
         pdf_filename, mm_to_pt(page_width), mm_to_pt(page_height)
     ) as surface:
+        if picture_locations:
+            decode_page(executor, picture_locations[0], image_surfaces)
         for page_number, page in enumerate(picture_locations):
             if page_number != 0:
                 surface.show_page()
 
+            if page_number + 1 < len(picture_locations):
+                decode_page(
+                    executor, picture_locations[page_number + 1], image_surfaces
+                )
+
+            ctx = cairo.Context(surface)
+            ctx.scale(mm_to_pt(1), mm_to_pt(1))  # Use mm as unit
+            ctx.translate(page_margin, page_margin)
+
             for picture_location in page:
-                ctx = cairo.Context(surface)
-                ctx.scale(mm_to_pt(1), mm_to_pt(1))  # Use mm as unit
-                ctx.translate(page_margin, page_margin)
+                ctx.save()
 
                 # Translate and rotate according to packing outcome
                 ctx.translate(picture_location.x, picture_location.y)
@@ -79,4 +144,18 @@ def render(
                     ctx.rotate(math.pi / 2.0)
                     ctx.translate(0, -picture_location.picture.height)
 
-                render_picture(ctx, picture_location.picture)
+                render_picture(
+                    ctx,
+                    picture_location.picture,
+                    image_surfaces[get_image_key(picture_location.picture)].result(),
+                )
+
+                ctx.restore()
+
+            # Release pictures not used by any later page. (NB: Cairo retains
+            # its own reference to any surface it still needs.)
+            for picture_location in page:
+                key = get_image_key(picture_location.picture)
+                if last_use.get(key) == page_number:
+                    del image_surfaces[key]
+                    del last_use[key]
@@ -35,6 +35,10 @@ class TestParseDimension:
             ("1mm", 1.0),
             ("1cm", 10.0),
             ("1 m", 1000.0),
+            # Leading and trailing whitespace
+            ("1mm ", 1.0),
+            (" 1mm", 1.0),
+            (" 1 mm ", 1.0),
         ],
     )
     def test_valid_cases(self, example: str, exp: float) -> None:
@@ -47,6 +51,8 @@ class TestParseDimension:
             "",
             # No digits
             ".",
+            # Malformed number
+            "1.2.3",
             # Just unit
             "mm",
             # Unknown unit
@@ -54,8 +60,9 @@ class TestParseDimension:
         ],
     )
     def test_invalid_cases(self, example: str) -> None:
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError) as excinfo:
             parse_dimension(example)
+        assert excinfo.value.args == (example,)
 
 
 def test_no_duplicate_arguments() -> None:
@@ -88,6 +95,10 @@ class TestParseArguments:
             parse_arguments(["", "--page-dimensions", "100"])
         with pytest.raises(ArgumentParserError):
             parse_arguments(["", "--page-dimensions", "100", "nope"])
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(["", "--page-dimensions", "0", "100"])
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(["", "--page-dimensions", "100", "0"])
 
     def test_page_dimensions_after_picture(self) -> None:
         with pytest.raises(ArgumentParserError):
@@ -115,6 +126,19 @@ class TestParseArguments:
         with pytest.raises(ArgumentParserError):
             parse_arguments(["", "--output"])
 
+    def test_packer(self) -> None:
+        args = parse_arguments([""])
+        assert args.packing_algorithm == "guillotine"
+
+        args = parse_arguments(["", "--packer", "maxrects"])
+        assert args.packing_algorithm == "maxrects"
+
+    def test_packer_bad(self) -> None:
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(["", "--packer"])
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(["", "--packer", "nope"])
+
     def test_picture_dimensions(self) -> None:
         args = parse_arguments(
             [
@@ -143,6 +167,14 @@ class TestParseArguments:
             parse_arguments(["", "--picture-dimensions", "100"])
         with pytest.raises(ArgumentParserError):
             parse_arguments(["", "--picture-dimensions", "100", "nope"])
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(["", "--picture-dimensions", "0", "100"])
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(["", "--picture-dimensions", "100", "0"])
+        with pytest.raises(ArgumentParserError):
+            parse_arguments(
+                ["", "--picture-dimensions", "100", "0", TEST_JPEG_PORTRAIT]
+            )
 
     def test_scale_or_crop(self) -> None:
         args = parse_arguments(
@@ -0,0 +1,68 @@
+import pytest
+
+from bulk_photo_print.picture import Picture
+
+from bulk_photo_print.packing import pack, PicturesDoNotFitError
+
+
+MM_PER_INCH = 25.4
+
+
+def make_picture(width: float, height: float) -> Picture:
+    return Picture(
+        filename="unused.jpg",
+        rotate_image=False,
+        has_alpha=False,
+        image_width=100,
+        image_height=100,
+        width=width,
+        height=height,
+        scale=1.0,
+        x_offset=0.0,
+        y_offset=0.0,
+    )
+
+
+@pytest.mark.parametrize(
+    "page_width, page_height, picture_width, picture_height, num_pictures",
+    [
+        # Three 2"x3" pictures on a 6"x4" page (two rotated)
+        (6 * MM_PER_INCH, 4 * MM_PER_INCH, 2 * MM_PER_INCH, 3 * MM_PER_INCH, 3),
+        # Twenty 2"x2" pictures on US letter with 0.25" margins
+        (
+            8.5 * MM_PER_INCH - 2 * 0.25 * MM_PER_INCH,
+            11 * MM_PER_INCH - 2 * 0.25 * MM_PER_INCH,
+            2 * MM_PER_INCH,
+            2 * MM_PER_INCH,
+            20,
+        ),
+    ],
+)
+def test_exact_tiling(
+    page_width: float,
+    page_height: float,
+    picture_width: float,
+    picture_height: float,
+    num_pictures: int,
+) -> None:
+    pictures = [
+        make_picture(picture_width, picture_height) for _ in range(num_pictures)
+    ]
+    pages = pack(pictures, page_width, page_height)
+    assert len(pages) == 1
+    assert len(pages[0]) == num_pictures
+
+
+def test_rotated() -> None:
+    picture = make_picture(20, 10)
+    ((location,),) = pack([picture], 10, 20)
+    assert location.rotated
+    assert (location.width, location.height) == (10.0, 20.0)
+
+
+def test_does_not_fit() -> None:
+    small = make_picture(10, 10)
+    big = make_picture(30, 30)
+    with pytest.raises(PicturesDoNotFitError) as excinfo:
+        pack([small, big], 20, 20)
+    assert excinfo.value.args == ([big],)
@@ -2,7 +2,16 @@ import pytest
 
 import os
 
-from bulk_photo_print.picture import Picture, FitMode
+from typing import Optional, Any
+
+from PIL import Image  # type: ignore
+
+from bulk_photo_print.picture import (
+    Picture,
+    FitMode,
+    read_image_info,
+    read_image_info_cached,
+)
 
 TEST_DIR = os.path.dirname(__file__)
 
@@ -11,11 +20,29 @@ TEST_JPEG_LANDSCAPE = os.path.join(TEST_DIR, "landscape.jpg")
 TEST_JPEG_SQUARE = os.path.join(TEST_DIR, "square.jpg")
 
 
+def test_read_image_info(tmpdir: Any) -> None:
+    filename = str(tmpdir.join("image.png"))
+    Image.new("RGB", (4, 3)).save(filename)
+    os.utime(filename, (1000, 1000))
+    assert read_image_info(filename) == (4, 3, False)
+
+    # Should be cached
+    hits = read_image_info_cached.cache_info().hits
+    assert read_image_info(filename) == (4, 3, False)
+    assert read_image_info_cached.cache_info().hits == hits + 1
+
+    # Cache should be invalidated on modification
+    Image.new("RGBA", (5, 6)).save(filename)
+    os.utime(filename, (2000, 2000))
+    assert read_image_info(filename) == (5, 6, True)
+
+
 class TestPicture:
     def test_image_size(self) -> None:
         pp = Picture.from_spec(TEST_JPEG_PORTRAIT, 1, 1)
         assert pp.image_width == 192
         assert pp.image_height == 256
+        assert not pp.has_alpha
 
         lp = Picture.from_spec(TEST_JPEG_LANDSCAPE, 1, 1)
         assert lp.image_width == 256
@@ -112,3 +139,52 @@ class TestPicture:
         assert p4.scale == 1 / 10.0
         assert p4.image_width == 256
         assert p4.image_height == 192
+
+    @pytest.mark.parametrize(
+        "desired_width, desired_height", [(25.6, 19.2), (19.2, 25.6)]
+    )
+    @pytest.mark.parametrize("pixels_per_mm", [None, 5.0, 2.0])
+    def test_get_image_bytes(
+        self,
+        desired_width: float,
+        desired_height: float,
+        pixels_per_mm: Optional[float],
+    ) -> None:
+        p = Picture.from_spec(
+            TEST_JPEG_LANDSCAPE,
+            desired_width,
+            desired_height,
+            pixels_per_mm=pixels_per_mm,
+        )
+        assert len(p.get_image_bytes()) == p.image_width * p.image_height * 4
+
+    @pytest.mark.parametrize(
+        "mode, has_alpha",
+        [("L", False), ("LA", True), ("RGB", False), ("RGBA", True), ("P", False)],
+    )
+    def test_get_image_bytes_mode(
+        self, tmpdir: Any, mode: str, has_alpha: bool
+    ) -> None:
+        filename = str(tmpdir.join("image.png"))
+        Image.new(mode, (4, 3)).save(filename)
+
+        p = Picture.from_spec(filename, 4, 3)
+        assert p.has_alpha == has_alpha
+        assert len(p.get_image_bytes()) == 4 * 3 * 4
+
+    def test_get_image_bytes_rotated(self, tmpdir: Any) -> None:
+        # Left half red, right half blue
+        filename = str(tmpdir.join("image.png"))
+        im = Image.new("RGB", (20, 10), (255, 0, 0))
+        im.paste((0, 0, 255), (10, 0, 20, 10))
+        im.save(filename)
+
+        p = Picture.from_spec(filename, 1, 2, pixels_per_mm=2.0)
+        assert p.rotate_image
+        assert (p.image_width, p.image_height) == (2, 4)
+
+        # After rotating clockwise, red should be at the top and blue at the
+        # bottom
+        data = p.get_image_bytes()
+        assert tuple(data[:3]) == (0, 0, 255)  # BGR
+        assert tuple(data[-4:-1]) == (255, 0, 0)  # BGR
@@ -0,0 +1,82 @@
+import pytest
+
+import os
+
+from typing import Any, Callable, List, Tuple
+
+from concurrent.futures import Executor, Future
+
+from PIL import Image  # type: ignore
+
+import cairo
+
+from bulk_photo_print.picture import Picture
+
+from bulk_photo_print.packing import PictureLocation
+
+from bulk_photo_print.render import (
+    get_image_key,
+    create_image_surface,
+    decode_page,
+)
+
+TEST_DIR = os.path.dirname(__file__)
+
+TEST_JPEG_PORTRAIT = os.path.join(TEST_DIR, "portrait.jpg")
+
+
+class RecordingExecutor(Executor):
+    """
+    An executor which records the arguments of submitted calls without running
+    them.
+    """
+
+    def __init__(self) -> None:
+        self.submitted: List[Tuple[Any, ...]] = []
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> "Future[Any]":
+        self.submitted.append(args)
+        return Future()
+
+
+def make_location(picture: Picture) -> PictureLocation:
+    return PictureLocation(picture, 0, 0, picture.width, picture.height, False)
+
+
+def test_decode_page_deduplicates() -> None:
+    executor = RecordingExecutor()
+    image_surfaces: Any = {}
+
+    # Identical placements share a key, different pixel sizes do not
+    small = Picture.from_spec(TEST_JPEG_PORTRAIT, 30, 40, pixels_per_mm=1.0)
+    small_again = Picture.from_spec(TEST_JPEG_PORTRAIT, 30, 40, pixels_per_mm=1.0)
+    large = Picture.from_spec(TEST_JPEG_PORTRAIT, 60, 80, pixels_per_mm=1.0)
+    assert get_image_key(small) == get_image_key(small_again)
+    assert get_image_key(small) != get_image_key(large)
+
+    page = [make_location(p) for p in (small, small_again, large)]
+    decode_page(executor, page, image_surfaces)
+    assert executor.submitted == [(small,), (large,)]
+    assert set(image_surfaces) == {get_image_key(small), get_image_key(large)}
+
+    # Pictures already being decoded (e.g. for an earlier page) are not
+    # submitted again
+    decode_page(executor, [make_location(small_again)], image_surfaces)
+    assert len(executor.submitted) == 2
+
+
+@pytest.mark.parametrize(
+    "mode, expected_format",
+    [("RGB", cairo.FORMAT_RGB24), ("RGBA", cairo.FORMAT_ARGB32)],
+)
+def test_create_image_surface_format(
+    tmpdir: Any, mode: str, expected_format: Any
+) -> None:
+    filename = str(tmpdir.join("image.png"))
+    Image.new(mode, (4, 3)).save(filename)
+
+    surface = create_image_surface(Picture.from_spec(filename, 4, 3))
+    assert surface.get_format() == expected_format
+    assert (surface.get_width(), surface.get_height()) == (4, 3)